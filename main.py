@@ -3,34 +3,78 @@ Weather Dashboard API
 A production-ready weather API with caching, location search, and forecast data.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Tuple
 import httpx
 import asyncio
-from datetime import datetime, timedelta
-import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import orjson
 import os
-from functools import lru_cache
-import hashlib
+import time
+from functools import lru_cache, partial
+from itertools import islice
+from cachetools import TTLCache
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
 # Configuration
 API_KEY = os.getenv("OPENWEATHER_API_KEY", "demo-api-key-for-showcase-purposes")
-BASE_URL = "http://api.openweathermap.org/data/2.5"
-GEO_URL = "http://api.openweathermap.org/geo/1.0"
+# HTTPS so the shared client can negotiate HTTP/2 (httpx only speaks it over TLS)
+BASE_URL = "https://api.openweathermap.org/data/2.5"
+GEO_URL = "https://api.openweathermap.org/geo/1.0"
+# Parsed once at import; per-request query strings are encoded by httpx via params=
+WEATHER_URL = httpx.URL(f"{BASE_URL}/weather")
+FORECAST_URL = httpx.URL(f"{BASE_URL}/forecast")
+GEO_DIRECT_URL = httpx.URL(f"{GEO_URL}/direct")
+AUTH_PARAMS = {"appid": API_KEY}  # Merged into every upstream query
+UPSTREAM_TIMEOUT = 5.0  # Overall deadline per upstream call, including waiting for a pooled connection
+REDIS_URL = os.getenv("REDIS_URL")  # Optional: share cached responses across workers
 
-# Simple in-memory cache (in production, use Redis)
-weather_cache = {}
+# Bounded in-memory cache; entries expire after CACHE_DURATION.
+# With Redis configured it shrinks to a short-lived L1 in front of Redis for hot keys.
 CACHE_DURATION = 600  # 10 minutes
+CACHE_MAX_ITEMS = 10_000
+# A Redis hit is only copied into L1 if it has at least L1_CACHE_DURATION left in Redis,
+# so a local copy never outlives the shared entry. /cache/clear empties Redis and the
+# handling worker's L1 only; other workers may serve cleared data for up to this long.
+L1_CACHE_DURATION = 30
+L1_CACHE_MAX_ITEMS = 256
+# Expiry runs on the monotonic clock: a cheap float compare, immune to wall-clock jumps.
+# datetime.now() is only used for user-visible timestamps.
+if REDIS_URL:
+    weather_cache = TTLCache(maxsize=L1_CACHE_MAX_ITEMS, ttl=L1_CACHE_DURATION, timer=time.monotonic)
+else:
+    weather_cache = TTLCache(maxsize=CACHE_MAX_ITEMS, ttl=CACHE_DURATION, timer=time.monotonic)
+REDIS_KEY_PREFIX = b"weather:"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one pooled HTTP client (and Redis, if configured) for the app's lifetime."""
+    app.state.http = httpx.AsyncClient(
+        http2=True,  # Multiplex concurrent upstream calls over one connection
+        timeout=httpx.Timeout(UPSTREAM_TIMEOUT, connect=2.0),
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0)
+    )
+    app.state.redis = aioredis.from_url(REDIS_URL, socket_timeout=1.0) if REDIS_URL else None
+    yield
+    await app.state.http.aclose()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
 
 app = FastAPI(
     title="Weather Dashboard API",
     description="Professional weather API with location search, forecasts, and caching",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson handles datetime natively and is much faster than stdlib json
+    lifespan=lifespan
 )
+app.state.redis = None  # Replaced by lifespan when REDIS_URL is set; keeps the cache usable without it
 
 # CORS middleware for frontend integration
 app.add_middleware(
@@ -76,6 +120,11 @@ class ForecastResponse(BaseModel):
     forecast: List[ForecastItem]
     timestamp: datetime
 
+class WeatherSummary(BaseModel):
+    current: Optional[WeatherResponse]
+    forecast: Optional[ForecastResponse]
+    errors: Dict[str, str]
+
 class LocationResult(BaseModel):
     name: str
     country: str
@@ -91,38 +140,249 @@ class WeatherAlert(BaseModel):
     timestamp: datetime
 
 # Cache utilities
-def get_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
-    """Generate a cache key from endpoint and parameters."""
-    param_str = json.dumps(params, sort_keys=True)
-    return hashlib.md5(f"{endpoint}:{param_str}".encode()).hexdigest()
-
-def is_cache_valid(timestamp: datetime) -> bool:
-    """Check if cached data is still valid."""
-    return datetime.now() - timestamp < timedelta(seconds=CACHE_DURATION)
-
-def cache_data(key: str, data: Any) -> None:
-    """Cache data with timestamp."""
-    weather_cache[key] = {
-        "data": data,
-        "timestamp": datetime.now()
-    }
+def get_cache_key(endpoint: str, *params: Any) -> Tuple[Any, ...]:
+    """Generate a cache key from endpoint and parameters (tuples hash directly, no encoding needed)."""
+    return (endpoint, *params)
 
-def get_cached_data(key: str) -> Optional[Any]:
-    """Get cached data if valid."""
-    if key in weather_cache:
-        cached = weather_cache[key]
-        if is_cache_valid(cached["timestamp"]):
-            return cached["data"]
-        else:
-            del weather_cache[key]  # Remove expired cache
-    return None
+def encode_model(obj: Any) -> Any:
+    """orjson default hook: encode Pydantic models wherever they appear in the data."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def serialize(data: Any) -> bytes:
+    """Serialize models (or any structure containing them) to JSON bytes with orjson."""
+    return orjson.dumps(data, default=encode_model)
+
+def redis_key(key: Tuple[Any, ...]) -> bytes:
+    """Encode a cache key tuple as an unambiguous Redis key."""
+    return REDIS_KEY_PREFIX + orjson.dumps(key)
+
+async def get_cached_data(key: Tuple[Any, ...]) -> Optional[bytes]:
+    """Get cached JSON bytes from the local cache, falling back to Redis."""
+    payload = weather_cache.get(key)
+    if payload is None and app.state.redis is not None:
+        try:
+            async with app.state.redis.pipeline(transaction=False) as pipe:
+                payload, ttl_ms = await pipe.get(redis_key(key)).pttl(redis_key(key)).execute()
+        except RedisError:
+            return None  # Treat an unreachable Redis as a cache miss
+        if payload is not None and ttl_ms >= L1_CACHE_DURATION * 1000:
+            weather_cache[key] = payload
+    return payload
+
+async def cache_data(key: Tuple[Any, ...], payload: bytes) -> None:
+    """Cache JSON bytes locally and, if configured, in Redis."""
+    weather_cache[key] = payload
+    if app.state.redis is not None:
+        try:
+            await app.state.redis.set(redis_key(key), payload, ex=CACHE_DURATION)
+        except RedisError:
+            pass  # The local cache still serves this worker
+
+def make_json_response(payload: bytes, cache_status: str) -> Response:
+    """Wrap pre-serialized JSON bytes in a response, skipping FastAPI's encoder."""
+    return Response(content=payload, media_type="application/json", headers={"X-Cache": cache_status})
 
 # HTTP client
-async def get_http_client():
-    """Get async HTTP client."""
-    return httpx.AsyncClient()
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Get the shared async HTTP client."""
+    return request.app.state.http
+
+# Request coalescing: concurrent cache misses for the same key share one upstream fetch
+_inflight: Dict[Tuple[Any, ...], asyncio.Task] = {}
+
+async def fetch_and_cache(key: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> bytes:
+    """Run fetch, then serialize and cache its result."""
+    payload = serialize(await fetch())
+    await cache_data(key, payload)
+    return payload
+
+def finish_fetch(key: Tuple[Any, ...], task: asyncio.Task) -> None:
+    """Drop a completed fetch from the in-flight map."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # Mark as retrieved so failures with no waiters aren't logged
+
+async def fetch_once(key: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> bytes:
+    """Run fetch for a cache miss, letting concurrent callers for the same key await its result."""
+    task = _inflight.get(key)
+    if task is None:
+        # The fetch runs in its own task so no single caller's cancellation can kill it
+        task = asyncio.create_task(fetch_and_cache(key, fetch))
+        task.add_done_callback(partial(finish_fetch, key))
+        _inflight[key] = task
+    return await asyncio.shield(task)
+
+async def capture_http_error(aw: Awaitable[Any]) -> Any:
+    """Await aw, returning (rather than raising) an HTTPException so sibling tasks keep running."""
+    try:
+        return await aw
+    except HTTPException as exc:
+        return exc
+
+async def get_or_fetch(key: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Tuple[bytes, str]:
+    """Return cached JSON bytes for key, fetching on a miss, along with the X-Cache status."""
+    cached_data = await get_cached_data(key)
+    if cached_data is not None:
+        return cached_data, "HIT"
+    return await fetch_once(key, fetch), "MISS"
+
+# Upstream fetchers
+def build_params(location: str, units: str) -> Dict[str, Any]:
+    """Build OpenWeather query params for a city name or 'lat,lon' coordinates."""
+    # Exactly one comma means coordinates; parse them with a single partition
+    head, sep, tail = location.partition(",")
+    if sep and "," not in tail:
+        try:
+            return {**AUTH_PARAMS, "lat": float(head), "lon": float(tail), "units": units}
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid coordinates format")
+    return {**AUTH_PARAMS, "q": location, "units": units}
+
+async def fetch_current_weather(client: httpx.AsyncClient, location: str, units: str) -> WeatherResponse:
+    """Fetch current weather from OpenWeather."""
+    try:
+        async with asyncio.timeout(UPSTREAM_TIMEOUT):
+            response = await client.get(WEATHER_URL, params=build_params(location, units))
+        
+        if response.status_code == 401:
+            raise HTTPException(status_code=503, detail="Weather service unavailable - API key required")
+        elif response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"Location '{location}' not found")
+        elif response.status_code != 200:
+            raise HTTPException(status_code=503, detail="Weather service temporarily unavailable")
+        
+        data = orjson.loads(response.content)
+        
+        # Transform API response to our model
+        weather_data = WeatherResponse(
+            location=data["name"],
+            country=data["sys"]["country"],
+            temperature=data["main"]["temp"],
+            feels_like=data["main"]["feels_like"],
+            humidity=data["main"]["humidity"],
+            pressure=data["main"]["pressure"],
+            visibility=data.get("visibility", 0),
+            wind_speed=data.get("wind", {}).get("speed", 0),
+            wind_direction=data.get("wind", {}).get("deg", 0),
+            weather_main=data["weather"][0]["main"],
+            weather_description=data["weather"][0]["description"].title(),
+            icon=data["weather"][0]["icon"],
+            sunrise=datetime.fromtimestamp(data["sys"]["sunrise"], tz=timezone.utc),
+            sunset=datetime.fromtimestamp(data["sys"]["sunset"], tz=timezone.utc),
+            timezone=data["timezone"],
+            timestamp=datetime.now()
+        )
+        
+        return weather_data
+        
+    except (TimeoutError, httpx.TimeoutException):
+        raise HTTPException(status_code=504, detail="Weather service timed out")
+    except httpx.RequestError:
+        raise HTTPException(status_code=503, detail="Unable to connect to weather service")
+
+async def fetch_weather_forecast(client: httpx.AsyncClient, location: str, units: str, days: int) -> ForecastResponse:
+    """Fetch the forecast from OpenWeather and aggregate it by day."""
+    try:
+        # Only request the slots we aggregate so shorter forecasts transfer and parse less
+        params = build_params(location, units)
+        params["cnt"] = days * 8
+        async with asyncio.timeout(UPSTREAM_TIMEOUT):
+            response = await client.get(FORECAST_URL, params=params)
+        
+        if response.status_code == 401:
+            raise HTTPException(status_code=503, detail="Weather service unavailable - API key required")
+        elif response.status_code == 404:
+            raise HTTPException(status_code=404, detail=f"Location '{location}' not found")
+        elif response.status_code != 200:
+            raise HTTPException(status_code=503, detail="Weather service temporarily unavailable")
+        
+        data = orjson.loads(response.content)
+        
+        # Process forecast data (group by UTC day) in a single pass, keeping running
+        # [temp_min, temp_max, humidity_sum, count, weather, wind_speed] per day
+        daily_forecasts = {}
+        for item in data["list"][:days * 8]:  # 8 forecasts per day (3-hour intervals)
+            date = item["dt"] // 86400  # Days since the epoch; formatted once per day below
+            readings = item["main"]
+            temp = readings["temp"]
+            
+            day = daily_forecasts.get(date)
+            if day is None:
+                daily_forecasts[date] = [temp, temp, readings["humidity"], 1, item["weather"][0], item["wind"]["speed"]]
+            else:
+                if temp < day[0]:
+                    day[0] = temp
+                elif temp > day[1]:
+                    day[1] = temp
+                day[2] += readings["humidity"]
+                day[3] += 1
+        
+        # Create forecast items
+        forecast_items = [
+            ForecastItem(
+                date=datetime.fromtimestamp(date * 86400, tz=timezone.utc).strftime("%Y-%m-%d"),
+                temperature_min=temp_min,
+                temperature_max=temp_max,
+                humidity=int(humidity_sum / count),
+                weather_main=weather["main"],
+                weather_description=weather["description"].title(),
+                icon=weather["icon"],
+                wind_speed=wind_speed
+            )
+            for date, (temp_min, temp_max, humidity_sum, count, weather, wind_speed) in islice(daily_forecasts.items(), days)
+        ]
+        
+        forecast_data = ForecastResponse(
+            location=data["city"]["name"],
+            country=data["city"]["country"],
+            forecast=forecast_items,
+            timestamp=datetime.now()
+        )
+        
+        return forecast_data
+        
+    except (TimeoutError, httpx.TimeoutException):
+        raise HTTPException(status_code=504, detail="Weather service timed out")
+    except httpx.RequestError:
+        raise HTTPException(status_code=503, detail="Unable to connect to weather service")
+
+async def fetch_locations(client: httpx.AsyncClient, query: str, limit: int) -> List[LocationResult]:
+    """Search OpenWeather's geocoding API for matching locations."""
+    try:
+        async with asyncio.timeout(UPSTREAM_TIMEOUT):
+            response = await client.get(GEO_DIRECT_URL, params={**AUTH_PARAMS, "q": query, "limit": limit})
+        
+        if response.status_code == 401:
+            raise HTTPException(status_code=503, detail="Location service unavailable - API key required")
+        elif response.status_code != 200:
+            raise HTTPException(status_code=503, detail="Location service temporarily unavailable")
+        
+        data = orjson.loads(response.content)
+        
+        locations = [
+            LocationResult(
+                name=item["name"],
+                country=item["country"],
+                state=item.get("state"),
+                lat=item["lat"],
+                lon=item["lon"]
+            )
+            for item in data
+        ]
+        
+        return locations
+        
+    except (TimeoutError, httpx.TimeoutException):
+        raise HTTPException(status_code=504, detail="Location service timed out")
+    except httpx.RequestError:
+        raise HTTPException(status_code=503, detail="Unable to connect to location service")
 
 # API endpoints
+# Read endpoints return Responses directly; models are attached via responses= so they
+# document the schema without FastAPI re-validating and re-encoding the output
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -132,6 +392,7 @@ async def root():
         "endpoints": {
             "/weather/current": "Get current weather for a location",
             "/weather/forecast": "Get 5-day weather forecast",
+            "/weather/summary": "Get current weather and forecast in one call",
             "/locations/search": "Search for locations",
             "/weather/alerts": "Get weather alerts (demo)",
             "/health": "Health check endpoint",
@@ -151,197 +412,91 @@ async def health_check():
         "api_key_configured": API_KEY != "demo_key_get_real_one_from_openweathermap"
     }
 
-@app.get("/weather/current", response_model=WeatherResponse)
+@app.get("/weather/current", responses={200: {"model": WeatherResponse}})
 async def get_current_weather(
     location: str = Query(..., description="City name or 'lat,lon' coordinates"),
-    units: str = Query("metric", description="Units: metric, imperial, kelvin")
+    units: str = Query("metric", description="Units: metric, imperial, kelvin"),
+    client: httpx.AsyncClient = Depends(get_http_client)
 ):
     """Get current weather for a location."""
     
-    # Check cache first
-    cache_key = get_cache_key("current", {"location": location, "units": units})
-    cached_data = get_cached_data(cache_key)
-    if cached_data:
-        return cached_data
-
-    try:
-        async with httpx.AsyncClient() as client:
-            # Determine if location is coordinates or city name
-            if "," in location and len(location.split(",")) == 2:
-                try:
-                    lat, lon = map(float, location.split(","))
-                    url = f"{BASE_URL}/weather?lat={lat}&lon={lon}&appid={API_KEY}&units={units}"
-                except ValueError:
-                    raise HTTPException(status_code=400, detail="Invalid coordinates format")
-            else:
-                url = f"{BASE_URL}/weather?q={location}&appid={API_KEY}&units={units}"
-            
-            response = await client.get(url)
-            
-            if response.status_code == 401:
-                raise HTTPException(status_code=503, detail="Weather service unavailable - API key required")
-            elif response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"Location '{location}' not found")
-            elif response.status_code != 200:
-                raise HTTPException(status_code=503, detail="Weather service temporarily unavailable")
-            
-            data = response.json()
-            
-            # Transform API response to our model
-            weather_data = WeatherResponse(
-                location=data["name"],
-                country=data["sys"]["country"],
-                temperature=data["main"]["temp"],
-                feels_like=data["main"]["feels_like"],
-                humidity=data["main"]["humidity"],
-                pressure=data["main"]["pressure"],
-                visibility=data.get("visibility", 0),
-                wind_speed=data.get("wind", {}).get("speed", 0),
-                wind_direction=data.get("wind", {}).get("deg", 0),
-                weather_main=data["weather"][0]["main"],
-                weather_description=data["weather"][0]["description"].title(),
-                icon=data["weather"][0]["icon"],
-                sunrise=datetime.fromtimestamp(data["sys"]["sunrise"]),
-                sunset=datetime.fromtimestamp(data["sys"]["sunset"]),
-                timezone=data["timezone"],
-                timestamp=datetime.now()
-            )
-            
-            # Cache the result
-            cache_data(cache_key, weather_data)
-            
-            return weather_data
-            
-    except httpx.RequestError:
-        raise HTTPException(status_code=503, detail="Unable to connect to weather service")
+    cache_key = get_cache_key("current", location, units)
+    payload, cache_status = await get_or_fetch(cache_key, lambda: fetch_current_weather(client, location, units))
+    return make_json_response(payload, cache_status)
 
-@app.get("/weather/forecast", response_model=ForecastResponse)
+@app.get("/weather/forecast", responses={200: {"model": ForecastResponse}})
 async def get_weather_forecast(
     location: str = Query(..., description="City name or 'lat,lon' coordinates"),
     units: str = Query("metric", description="Units: metric, imperial, kelvin"),
-    days: int = Query(5, ge=1, le=5, description="Number of forecast days (1-5)")
+    days: int = Query(5, ge=1, le=5, description="Number of forecast days (1-5)"),
+    client: httpx.AsyncClient = Depends(get_http_client)
 ):
     """Get weather forecast for a location."""
     
-    # Check cache first
-    cache_key = get_cache_key("forecast", {"location": location, "units": units, "days": days})
-    cached_data = get_cached_data(cache_key)
-    if cached_data:
-        return cached_data
+    cache_key = get_cache_key("forecast", location, units, days)
+    payload, cache_status = await get_or_fetch(cache_key, lambda: fetch_weather_forecast(client, location, units, days))
+    return make_json_response(payload, cache_status)
 
+@app.get("/weather/summary", responses={200: {"model": WeatherSummary}})
+async def get_weather_summary(
+    location: str = Query(..., description="City name or 'lat,lon' coordinates"),
+    units: str = Query("metric", description="Units: metric, imperial, kelvin"),
+    days: int = Query(5, ge=1, le=5, description="Number of forecast days (1-5)"),
+    client: httpx.AsyncClient = Depends(get_http_client)
+):
+    """Get current weather and forecast for a location, fetched concurrently."""
+    
+    current_key = get_cache_key("current", location, units)
+    forecast_key = get_cache_key("forecast", location, units, days)
+    # Expected HTTP errors are captured per half; anything else cancels the sibling
     try:
-        async with httpx.AsyncClient() as client:
-            # Determine if location is coordinates or city name
-            if "," in location and len(location.split(",")) == 2:
-                try:
-                    lat, lon = map(float, location.split(","))
-                    url = f"{BASE_URL}/forecast?lat={lat}&lon={lon}&appid={API_KEY}&units={units}"
-                except ValueError:
-                    raise HTTPException(status_code=400, detail="Invalid coordinates format")
-            else:
-                url = f"{BASE_URL}/forecast?q={location}&appid={API_KEY}&units={units}"
-            
-            response = await client.get(url)
-            
-            if response.status_code == 401:
-                raise HTTPException(status_code=503, detail="Weather service unavailable - API key required")
-            elif response.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"Location '{location}' not found")
-            elif response.status_code != 200:
-                raise HTTPException(status_code=503, detail="Weather service temporarily unavailable")
-            
-            data = response.json()
-            
-            # Process forecast data (group by day)
-            daily_forecasts = {}
-            for item in data["list"][:days * 8]:  # 8 forecasts per day (3-hour intervals)
-                date = datetime.fromtimestamp(item["dt"]).strftime("%Y-%m-%d")
-                
-                if date not in daily_forecasts:
-                    daily_forecasts[date] = {
-                        "temps": [],
-                        "humidity": [],
-                        "weather": item["weather"][0],
-                        "wind_speed": item["wind"]["speed"]
-                    }
-                
-                daily_forecasts[date]["temps"].append(item["main"]["temp"])
-                daily_forecasts[date]["humidity"].append(item["main"]["humidity"])
-            
-            # Create forecast items
-            forecast_items = []
-            for date, day_data in list(daily_forecasts.items())[:days]:
-                forecast_items.append(ForecastItem(
-                    date=date,
-                    temperature_min=min(day_data["temps"]),
-                    temperature_max=max(day_data["temps"]),
-                    humidity=int(sum(day_data["humidity"]) / len(day_data["humidity"])),
-                    weather_main=day_data["weather"]["main"],
-                    weather_description=day_data["weather"]["description"].title(),
-                    icon=day_data["weather"]["icon"],
-                    wind_speed=day_data["wind_speed"]
-                ))
-            
-            forecast_data = ForecastResponse(
-                location=data["city"]["name"],
-                country=data["city"]["country"],
-                forecast=forecast_items,
-                timestamp=datetime.now()
-            )
-            
-            # Cache the result
-            cache_data(cache_key, forecast_data)
-            
-            return forecast_data
-            
-    except httpx.RequestError:
-        raise HTTPException(status_code=503, detail="Unable to connect to weather service")
+        async with asyncio.TaskGroup() as tg:
+            current_task = tg.create_task(capture_http_error(
+                get_or_fetch(current_key, lambda: fetch_current_weather(client, location, units))
+            ))
+            forecast_task = tg.create_task(capture_http_error(
+                get_or_fetch(forecast_key, lambda: fetch_weather_forecast(client, location, units, days))
+            ))
+    except ExceptionGroup as group:
+        raise group.exceptions[0]  # Surface the real error rather than the TaskGroup wrapper
+    results = (current_task.result(), forecast_task.result())
+    
+    # Return whichever half succeeded; only fail outright if both did
+    payloads = {"current": b"null", "forecast": b"null"}
+    errors = {}
+    cache_status = "HIT"
+    for name, result in zip(payloads, results):
+        if isinstance(result, HTTPException):
+            errors[name] = result.detail
+            cache_status = "MISS"
+        else:
+            payloads[name], status = result
+            if status != "HIT":
+                cache_status = "MISS"
+    if len(errors) == len(payloads):
+        raise results[0]
+    
+    # Splice the cached JSON bytes together rather than re-parsing them
+    payload = (
+        b'{"current":' + payloads["current"]
+        + b',"forecast":' + payloads["forecast"]
+        + b',"errors":' + orjson.dumps(errors) + b"}"
+    )
+    return make_json_response(payload, cache_status)
 
-@app.get("/locations/search", response_model=List[LocationResult])
+@app.get("/locations/search", responses={200: {"model": List[LocationResult]}})
 async def search_locations(
     query: str = Query(..., min_length=2, description="Location name to search"),
-    limit: int = Query(5, ge=1, le=10, description="Maximum number of results")
+    limit: int = Query(5, ge=1, le=10, description="Maximum number of results"),
+    client: httpx.AsyncClient = Depends(get_http_client)
 ):
     """Search for locations by name."""
     
-    # Check cache first
-    cache_key = get_cache_key("locations", {"query": query, "limit": limit})
-    cached_data = get_cached_data(cache_key)
-    if cached_data:
-        return cached_data
+    cache_key = get_cache_key("locations", query, limit)
+    payload, cache_status = await get_or_fetch(cache_key, lambda: fetch_locations(client, query, limit))
+    return make_json_response(payload, cache_status)
 
-    try:
-        async with httpx.AsyncClient() as client:
-            url = f"{GEO_URL}/direct?q={query}&limit={limit}&appid={API_KEY}"
-            response = await client.get(url)
-            
-            if response.status_code == 401:
-                raise HTTPException(status_code=503, detail="Location service unavailable - API key required")
-            elif response.status_code != 200:
-                raise HTTPException(status_code=503, detail="Location service temporarily unavailable")
-            
-            data = response.json()
-            
-            locations = [
-                LocationResult(
-                    name=item["name"],
-                    country=item["country"],
-                    state=item.get("state"),
-                    lat=item["lat"],
-                    lon=item["lon"]
-                )
-                for item in data
-            ]
-            
-            # Cache the result
-            cache_data(cache_key, locations)
-            
-            return locations
-            
-    except httpx.RequestError:
-        raise HTTPException(status_code=503, detail="Unable to connect to location service")
-
-@app.get("/weather/alerts", response_model=List[WeatherAlert])
+@app.get("/weather/alerts", responses={200: {"model": List[WeatherAlert]}})
 async def get_weather_alerts(
     location: str = Query(..., description="Location to get alerts for")
 ):
@@ -358,34 +513,37 @@ async def get_weather_alerts(
         )
     ]
     
-    return demo_alerts
+    return ORJSONResponse(content=[alert.model_dump() for alert in demo_alerts])
 
 @app.get("/cache/stats")
 async def get_cache_stats():
     """Get cache statistics (for monitoring)."""
-    valid_cache = 0
-    expired_cache = 0
-    
-    for key, cached in weather_cache.items():
-        if is_cache_valid(cached["timestamp"]):
-            valid_cache += 1
-        else:
-            expired_cache += 1
+    expired = weather_cache.expire()  # Purge expired entries (returns them on cachetools>=5.5)
     
     return {
         "total_cache_items": len(weather_cache),
-        "valid_cache_items": valid_cache,
-        "expired_cache_items": expired_cache,
-        "cache_duration_seconds": CACHE_DURATION,
-        "cache_keys": list(weather_cache.keys())[:10]  # Show first 10 keys
+        "valid_cache_items": len(weather_cache),
+        "expired_cache_items": len(expired),
+        "cache_duration_seconds": weather_cache.ttl,  # Local cache; the 30s L1 when Redis is enabled
+        "cache_max_items": weather_cache.maxsize,
+        "redis_enabled": app.state.redis is not None,
+        "redis_cache_duration_seconds": CACHE_DURATION if app.state.redis is not None else None,
+        "cache_keys": list(islice(weather_cache, 10))  # Show first 10 keys
     }
 
 @app.delete("/cache/clear")
 async def clear_cache():
     """Clear all cached data."""
-    global weather_cache
     cache_count = len(weather_cache)
-    weather_cache = {}
+    weather_cache.clear()
+    
+    # Every locally cached key is also in Redis, so report the shared count when enabled
+    if app.state.redis is not None:
+        try:
+            keys = [key async for key in app.state.redis.scan_iter(match=REDIS_KEY_PREFIX + b"*")]
+            cache_count = await app.state.redis.delete(*keys) if keys else 0
+        except RedisError:
+            raise HTTPException(status_code=503, detail="Unable to clear shared cache")
     
     return {
         "message": f"Cache cleared successfully",
@@ -398,6 +556,12 @@ if __name__ == "__main__":
     print("🌤️  Starting Weather Dashboard API...")
     print("📡 CORS: Allowing all origins for development")
     print("🔍 API Documentation: http://localhost:8002/docs")
-    print("💾 Cache: In-memory caching enabled (10-minute duration)")
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    print(f"⚙️  Workers: {workers} (uvloop + httptools)")
+    if REDIS_URL:
+        print("💾 Cache: Redis shared cache (10-minute duration) with 30-second per-worker cache")
+    else:
+        print("💾 Cache: In-memory caching enabled (10-minute duration, per worker)")
     print("🗝️  API Key: Get your free key from https://openweathermap.org/api")
-    uvicorn.run(app, host="0.0.0.0", port=8002)
+    # uvloop and httptools ship with uvicorn[standard]; workers need the app as an import string
+    uvicorn.run("main:app", host="0.0.0.0", port=8002, loop="uvloop", http="httptools", workers=workers)
@@ -0,0 +1,56 @@
+"""
+Tests for the Weather Dashboard API.
+"""
+
+import asyncio
+
+import main
+from main import ForecastItem, fetch_once, weather_cache
+
+
+def test_fetch_once_survives_leader_cancellation():
+    """A waiter still gets the shared result when the caller that started the fetch is cancelled."""
+    key = ("test", "leader-cancelled")
+    item = ForecastItem(
+        date="2024-01-01",
+        temperature_min=1.0,
+        temperature_max=2.0,
+        humidity=50,
+        weather_main="Clear",
+        weather_description="Clear Sky",
+        icon="01d",
+        wind_speed=3.0
+    )
+    calls = 0
+
+    async def run():
+        nonlocal calls
+        release = asyncio.Event()
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return item
+
+        leader = asyncio.create_task(fetch_once(key, fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(fetch_once(key, fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        payload = await waiter
+        assert leader.cancelled()
+        return payload
+
+    try:
+        payload = asyncio.run(run())
+    finally:
+        weather_cache.pop(key, None)
+
+    assert payload == main.serialize(item)
+    assert calls == 1
+    assert key not in main._inflight